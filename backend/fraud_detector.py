@@ -1,5 +1,6 @@
 import networkx as nx
 import pandas as pd
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from datetime import datetime, timedelta
 
@@ -258,6 +259,149 @@ class FraudDetector:
         
         return structuring_cases
     
+    def detect_pass_through(self, tolerance=0.10, window_hours=24, min_amount=5000,
+                            exclude_txn_ids=None):
+        """Detecta cuentas de paso (dinero que entra y sale rápidamente)
+        
+        Barrido en orden temporal: para cada entrada, la ventana de salidas
+        dentro de `window_hours` termina en la primera salida cuyo acumulado
+        cubre el monto entrante (búsqueda binaria). Si la ventana se pasa de la
+        tolerancia, su primera salida se descarta como ruido y se prueba la
+        siguiente. Las salidas descartadas o usadas en una coincidencia no se
+        vuelven a considerar, así que el inicio de ventana solo avanza y el
+        costo es O(n log n). Los casos cuyas transacciones están todas en
+        `exclude_txn_ids` (p. ej. tramos de ciclos ya detectados) se omiten.
+        """
+        pass_through_cases = []
+        exclude_txn_ids = exclude_txn_ids or set()
+        
+        inflows = defaultdict(list)
+        outflows = defaultdict(list)
+        
+        for _, row in self.df.iterrows():
+            if row['from_account'] == row['to_account']:
+                continue
+            
+            txn = {
+                'amount': row['amount'],
+                'timestamp': datetime.fromisoformat(row['timestamp']),
+                'txn': {
+                    'id': row['transaction_id'],
+                    'amount': row['amount'],
+                    'timestamp': row['timestamp'],
+                    'from_account': row['from_account'],
+                    'to_account': row['to_account']
+                }
+            }
+            inflows[row['to_account']].append(txn)
+            outflows[row['from_account']].append(txn)
+        
+        window = timedelta(hours=window_hours)
+        
+        for account, in_txns in inflows.items():
+            out_txns = outflows.get(account)
+            if not out_txns:
+                continue
+            
+            in_sorted = sorted(in_txns, key=lambda x: x['timestamp'])
+            out_sorted = sorted(out_txns, key=lambda x: x['timestamp'])
+            out_times = [t['timestamp'] for t in out_sorted]
+            
+            # Sumas acumuladas de salidas: out_cumsum[k] = suma de las primeras k salidas
+            out_cumsum = [0.0]
+            for t in out_sorted:
+                out_cumsum.append(out_cumsum[-1] + t['amount'])
+            
+            best_case = None
+            
+            # Inicio de ventana compartido por todas las entradas: solo avanza
+            first = 0
+            
+            for in_txn in in_sorted:
+                in_amount = in_txn['amount']
+                if in_amount < min_amount:
+                    continue
+                
+                in_time = in_txn['timestamp']
+                start = bisect_left(out_times, in_time)
+                end = bisect_right(out_times, in_time + window)
+                first = max(first, start)
+                
+                k = None
+                while first < end:
+                    # Primera salida k tal que lo acumulado desde `first` alcanza el monto entrante
+                    target = out_cumsum[first] + in_amount * (1 - tolerance)
+                    k = bisect_left(out_cumsum, target, first + 1, end + 1)
+                    
+                    # Desde inicios posteriores el acumulado disponible solo disminuye
+                    if k > end:
+                        k = None
+                        break
+                    
+                    if out_cumsum[k] - out_cumsum[first] <= in_amount * (1 + tolerance):
+                        break
+                    
+                    # La ventana se pasa del monto: la salida `first` es ruido
+                    k = None
+                    first += 1
+                
+                if k is None:
+                    continue
+                
+                out_amount = out_cumsum[k] - out_cumsum[first]
+                difference = abs(out_amount - in_amount) / in_amount
+                matched_txns = [in_txn['txn']] + [t['txn'] for t in out_sorted[first:k]]
+                dwell_time = (out_times[k - 1] - in_time).total_seconds() / 3600
+                num_outflows = k - first
+                
+                # Las salidas usadas quedan asignadas a esta entrada
+                first = k
+                
+                if all(t['id'] in exclude_txn_ids for t in matched_txns):
+                    continue
+                
+                risk_score = 30
+                
+                if difference < 0.02:
+                    risk_score += 25
+                elif difference < 0.05:
+                    risk_score += 15
+                
+                if dwell_time < 1:
+                    risk_score += 30
+                elif dwell_time < 6:
+                    risk_score += 20
+                elif dwell_time < 24:
+                    risk_score += 10
+                
+                if in_amount > 20000:
+                    risk_score += 20
+                elif in_amount > 10000:
+                    risk_score += 10
+                
+                risk_score = min(risk_score, 100)
+                
+                if risk_score < 50:
+                    continue
+                
+                if best_case is None or risk_score > best_case['risk_score']:
+                    best_case = {
+                        'type': 'pass_through',
+                        'account': account,
+                        'inflow_amount': round(in_amount, 2),
+                        'outflow_amount': round(out_amount, 2),
+                        'amount_difference': round(difference * 100, 2),
+                        'dwell_time_hours': round(dwell_time, 2),
+                        'num_outflows': num_outflows,
+                        'risk_score': risk_score,
+                        'transactions': matched_txns
+                    }
+            
+            if best_case:
+                pass_through_cases.append(best_case)
+        
+        return pass_through_cases
+    
     def detect_high_centrality(self, top_n=10):
         """Detecta cuentas con alta centralidad"""
         centrality_cases = []
@@ -324,15 +468,20 @@ class FraudDetector:
         print("🔍 INICIANDO DETECCIÓN DE FRAUDE")
         print("="*60)
         
+        cycles = self.detect_cycles()
+        cycle_txn_ids = {txn['id'] for cycle in cycles for txn in cycle['transactions']}
+        
         results = {
-            'cycles': self.detect_cycles(),
+            'cycles': cycles,
             'structuring': self.detect_structuring(),
+            'pass_through': self.detect_pass_through(exclude_txn_ids=cycle_txn_ids),
             'high_centrality': self.detect_high_centrality()
         }
         
         all_alerts = []
         all_alerts.extend(results['cycles'])
         all_alerts.extend(results['structuring'])
+        all_alerts.extend(results['pass_through'])
         all_alerts.extend(results['high_centrality'])
         
         all_alerts.sort(key=lambda x: x['risk_score'], reverse=True)
@@ -342,6 +491,7 @@ class FraudDetector:
         print("="*60)
         print(f"   - Ciclos detectados:           {len(results['cycles'])}")
         print(f"   - Estructuración detectada:    {len(results['structuring'])}")
+        print(f"   - Cuentas de paso:             {len(results['pass_through'])}")
         print(f"   - Cuentas de alto riesgo:      {len(results['high_centrality'])}")
         print(f"   - TOTAL ALERTAS:               {len(all_alerts)}")
         print("="*60 + "\n")
@@ -352,6 +502,7 @@ class FraudDetector:
             'summary': {
                 'cycles_detected': len(results['cycles']),
                 'structuring_detected': len(results['structuring']),
+                'pass_through_detected': len(results['pass_through']),
                 'high_risk_accounts': len(results['high_centrality'])
             },
             'graph_stats': {
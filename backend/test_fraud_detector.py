@@ -0,0 +1,124 @@
+import pandas as pd
+
+from fraud_detector import FraudDetector
+
+
+def make_detector(rows):
+    """Crea un detector a partir de tuplas (from, to, amount, timestamp)"""
+    df = pd.DataFrame([
+        {
+            'transaction_id': f"TXN{i:06d}",
+            'from_account': from_acc,
+            'to_account': to_acc,
+            'amount': amount,
+            'timestamp': timestamp
+        }
+        for i, (from_acc, to_acc, amount, timestamp) in enumerate(rows, start=1)
+    ])
+    return FraudDetector(df)
+
+
+def test_pass_through_one_to_one():
+    detector = make_detector([
+        ('X', 'P', 20000, '2025-01-01T10:00:00'),
+        ('P', 'Y', 19800, '2025-01-01T10:30:00'),
+    ])
+    cases = detector.detect_pass_through()
+    assert len(cases) == 1
+    assert cases[0]['account'] == 'P'
+    assert cases[0]['num_outflows'] == 1
+    assert cases[0]['outflow_amount'] == 19800
+    assert cases[0]['dwell_time_hours'] == 0.5
+
+
+def test_pass_through_split_outflows():
+    detector = make_detector([
+        ('X', 'P', 20000, '2025-01-01T10:00:00'),
+        ('P', 'Y', 9900, '2025-01-01T10:30:00'),
+        ('P', 'Z', 9800, '2025-01-01T11:00:00'),
+    ])
+    cases = detector.detect_pass_through()
+    assert len(cases) == 1
+    assert cases[0]['num_outflows'] == 2
+    assert cases[0]['outflow_amount'] == 19700
+    assert [t['id'] for t in cases[0]['transactions']] == ['TXN000001', 'TXN000002', 'TXN000003']
+
+
+def test_pass_through_outflow_outside_window():
+    detector = make_detector([
+        ('X', 'P', 20000, '2025-01-01T10:00:00'),
+        ('P', 'Y', 19800, '2025-01-02T10:00:01'),
+    ])
+    assert detector.detect_pass_through(window_hours=24) == []
+
+
+def test_pass_through_ignores_small_inflow():
+    detector = make_detector([
+        ('X', 'P', 4000, '2025-01-01T10:00:00'),
+        ('P', 'Y', 4000, '2025-01-01T10:10:00'),
+    ])
+    assert detector.detect_pass_through(min_amount=5000) == []
+
+
+def test_pass_through_rejects_outside_tolerance():
+    detector = make_detector([
+        ('X', 'P', 20000, '2025-01-01T10:00:00'),
+        ('P', 'Y', 17000, '2025-01-01T10:30:00'),
+    ])
+    assert detector.detect_pass_through(tolerance=0.10) == []
+
+
+def test_pass_through_skips_unrelated_first_outflow():
+    detector = make_detector([
+        ('X', 'P', 20000, '2025-01-01T10:00:00'),
+        ('P', 'Z', 3000, '2025-01-01T10:05:00'),
+        ('P', 'Y', 19800, '2025-01-01T10:30:00'),
+    ])
+    cases = detector.detect_pass_through()
+    assert len(cases) == 1
+    assert cases[0]['num_outflows'] == 1
+    assert [t['id'] for t in cases[0]['transactions']] == ['TXN000001', 'TXN000003']
+
+
+def test_pass_through_ignores_self_transfer():
+    detector = make_detector([
+        ('P', 'P', 20000, '2025-01-01T10:00:00'),
+    ])
+    assert detector.detect_pass_through() == []
+
+
+def test_pass_through_excludes_cycle_legs():
+    detector = make_detector([
+        ('A', 'B', 15000, '2025-01-01T10:00:00'),
+        ('B', 'C', 15100, '2025-01-01T10:20:00'),
+        ('C', 'A', 14900, '2025-01-01T10:45:00'),
+    ])
+    results = detector.analyze_all()
+    assert results['summary']['cycles_detected'] == 1
+    assert results['summary']['pass_through_detected'] == 0
+
+
+def test_pass_through_skips_several_noisy_outflows():
+    detector = make_detector([
+        ('X', 'P', 20000, '2025-01-01T10:00:00'),
+        ('P', 'Z', 3000, '2025-01-01T10:05:00'),
+        ('P', 'W', 2500, '2025-01-01T10:10:00'),
+        ('P', 'Y', 19800, '2025-01-01T10:30:00'),
+        ('Q', 'P', 12000, '2025-01-01T12:00:00'),
+        ('P', 'V', 4000, '2025-01-01T12:05:00'),
+        ('P', 'U', 11900, '2025-01-01T12:20:00'),
+    ])
+    cases = detector.detect_pass_through()
+    assert len(cases) == 1
+    assert [t['id'] for t in cases[0]['transactions']] == ['TXN000001', 'TXN000004']
+
+
+def test_pass_through_outflows_used_once():
+    detector = make_detector([
+        ('X', 'P', 20000, '2025-01-01T10:00:00'),
+        ('Y', 'P', 20000, '2025-01-01T10:10:00'),
+        ('P', 'Z', 19800, '2025-01-01T10:30:00'),
+    ])
+    cases = detector.detect_pass_through()
+    assert len(cases) == 1
+    assert [t['id'] for t in cases[0]['transactions']] == ['TXN000001', 'TXN000003']
@@ -42,6 +42,7 @@ function AlertsList({ alerts }) {
     switch(type) {
       case 'cycle': return '🔄';
       case 'structuring': return '🔀';
+      case 'pass_through': return '⏩';
       case 'high_centrality': return '🎯';
       default: return '⚠️';
     }
@@ -51,6 +52,7 @@ function AlertsList({ alerts }) {
     switch(type) {
       case 'cycle': return 'Ciclo Detectado';
       case 'structuring': return 'Estructuración (Smurfing)';
+      case 'pass_through': return 'Cuenta de Paso';
       case 'high_centrality': return 'Alta Centralidad';
       default: return 'Alerta';
     }
@@ -139,6 +141,45 @@ function AlertsList({ alerts }) {
     );
   };
 
+  // Tabla de la entrada y las salidas de una cuenta de paso
+  const renderPassThroughTransactions = (alert) => {
+    if (!alert.transactions || alert.transactions.length === 0) {
+      return null;
+    }
+
+    return (
+      <div className="transactions-table">
+        <h4>📋 Entrada y Salidas</h4>
+        <table>
+          <thead>
+            <tr>
+              <th>Tipo</th>
+              <th>ID Transacción</th>
+              <th>Desde</th>
+              <th>→</th>
+              <th>Hacia</th>
+              <th>Monto</th>
+              <th>Fecha/Hora</th>
+            </tr>
+          </thead>
+          <tbody>
+            {alert.transactions.map((txn, idx) => (
+              <tr key={idx}>
+                <td className="step-number">{txn.to_account === alert.account ? 'Entrada' : 'Salida'}</td>
+                <td className="txn-id">{txn.id}</td>
+                <td><span className="account-mini">{txn.from_account}</span></td>
+                <td className="arrow-cell">→</td>
+                <td><span className="account-mini">{txn.to_account}</span></td>
+                <td className="amount">${txn.amount.toLocaleString('es-ES', {minimumFractionDigits: 2, maximumFractionDigits: 2})}</td>
+                <td className="timestamp">{formatTimestamp(txn.timestamp)}</td>
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    );
+  };
+
   return (
     <div className="alerts-container">
       <div className="alerts-header">
@@ -153,6 +194,7 @@ function AlertsList({ alerts }) {
             <option value="all">Todos ({alerts.length})</option>
             <option value="cycle">Ciclos ({alerts.filter(a => a.type === 'cycle').length})</option>
             <option value="structuring">Estructuración ({alerts.filter(a => a.type === 'structuring').length})</option>
+            <option value="pass_through">Cuentas de Paso ({alerts.filter(a => a.type === 'pass_through').length})</option>
             <option value="high_centrality">Alta Centralidad ({alerts.filter(a => a.type === 'high_centrality').length})</option>
           </select>
         </div>
@@ -255,6 +297,36 @@ function AlertsList({ alerts }) {
                   </>
                 )}
 
+                {alert.type === 'pass_through' && (
+                  <>
+                    <div className="alert-detail">
+                      <strong>Cuenta:</strong> <span className="account-badge">{alert.account}</span>
+                    </div>
+                    {renderPassThroughTransactions(alert)}
+
+                    <div className="alert-detail">
+                      <strong>Monto entrante:</strong> ${alert.inflow_amount.toLocaleString()}
+                    </div>
+                    <div className="alert-detail">
+                      <strong>Monto saliente:</strong> ${alert.outflow_amount.toLocaleString()}
+                      {' '}({alert.num_outflows} {alert.num_outflows === 1 ? 'transacción' : 'transacciones'})
+                    </div>
+                    <div className="alert-detail">
+                      <strong>Diferencia de montos:</strong> {alert.amount_difference}%
+                      {alert.amount_difference < 5 && <span className="warning-badge">⚠️ Entrada ≈ Salida</span>}
+                    </div>
+                    <div className="alert-detail">
+                      <strong>Tiempo de permanencia:</strong> {alert.dwell_time_hours.toFixed(1)} horas
+                      {alert.dwell_time_hours < 6 && <span className="warning-badge">⚠️ Salida inmediata</span>}
+                    </div>
+                    <div className="alert-info">
+                      ℹ️ El dinero llega a esta cuenta y sale de nuevo por un monto similar en pocas horas.
+                      Este patrón de capas (layering) es típico de cuentas usadas solo como tránsito para
+                      alejar los fondos de su origen.
+                    </div>
+                  </>
+                )}
+
                 {alert.type === 'high_centrality' && (
                   <>
                     <div className="alert-detail">
@@ -76,6 +76,12 @@ function Dashboard({ stats, summary, graphStats }) {
             <p>Múltiples transacciones pequeñas</p>
           </div>
 
+          <div className="analysis-card">
+            <h4>⏩ Cuentas de Paso</h4>
+            <div className="analysis-number">{summary.pass_through_detected}</div>
+            <p>Dinero que entra y sale rápidamente</p>
+          </div>
+
           <div className="analysis-card">
             <h4>🎯 Cuentas de Alto Riesgo</h4>
             <div className="analysis-number">{summary.high_risk_accounts}</div>